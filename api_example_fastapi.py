@@ -1,14 +1,17 @@
+# Run with:  uvicorn api_example_fastapi:app --loop uvloop
+# uvloop (optional) gives cheaper socket handling for many concurrent downloads;
+# uvicorn's default --loop auto also picks it up when it is installed.
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, List
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Query
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from youtube_downloader import DownloadConfig, YouTubeDownloadService
 
-
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 service = YouTubeDownloadService(default_output_dir="downloads")
 
 
@@ -21,14 +24,21 @@ class DownloadRequest(BaseModel):
     format: str | None = None
 
 
+@app.on_event("shutdown")
+async def shutdown() -> None:
+    """Release the download service's worker threads and cached resources."""
+    await service.aclose()
+
+
 @app.get("/info")
-def get_info(url: str) -> Dict[str, Any]:
-    """Return metadata for a YouTube URL."""
-    return service.get_info(url)
+async def get_info(url: str, fields: List[str] | None = Query(None)) -> ORJSONResponse:
+    """Return metadata for a YouTube URL, optionally limited to the given fields."""
+    # Return the response directly so the large info dict skips response-model validation
+    return ORJSONResponse(content=await service.get_info_async(url, fields=fields))
 
 
 @app.post("/download")
-def download(req: DownloadRequest) -> Dict[str, Any]:
+async def download(req: DownloadRequest) -> Dict[str, Any]:
     """Download a video or audio, returning basic result info."""
     config = DownloadConfig(
         url=req.url,
@@ -36,7 +46,7 @@ def download(req: DownloadRequest) -> Dict[str, Any]:
         playlist_items=req.playlist_items,
         format=req.format or "best",
     )
-    result = service.download(config)
+    result = await service.download_async(config)
     return {
         "success": result.success,
         "files": result.filepaths,
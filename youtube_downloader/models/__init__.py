@@ -1,16 +1,23 @@
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Literal, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Literal, Mapping, NamedTuple, Optional
 
 
+_PATH_SEPARATORS = os.sep + (os.altsep or "")
+
 ProgressCallback = Callable[["ProgressEvent"], None]
 LogCallback = Callable[["LogEvent"], None]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DownloadConfig:
-    """Configuration for a single yt-dlp download task."""
+    """Configuration for a single yt-dlp download task.
+
+    Instances are immutable; use ``dataclasses.replace`` to derive a variant.
+    """
 
     url: str
     output_dir: str = "downloads"
@@ -22,11 +29,33 @@ class DownloadConfig:
     retries: int = 3
     proxy: Optional[str] = None
     extra_yt_dlp_options: Dict[str, Any] = field(default_factory=dict)
+    # Attach yt-dlp's status dict to ProgressEvent.raw. Off by default because it
+    # references the full info dict, which retained events would keep alive.
+    include_raw_progress: bool = False
+
+    def resolved_outtmpl(self, default_dir: str) -> str:
+        """Return the yt-dlp output template, falling back to ``default_dir``.
+
+        Matches os.path.join: an absolute ``filename_template`` is used as-is and a
+        trailing separator on the directory is not doubled. The join itself is a
+        plain ``/``, which yt-dlp accepts on every platform.
+        """
+        directory = self.output_dir or default_dir
+        if not directory or os.path.isabs(self.filename_template):
+            return self.filename_template
+        return f"{directory.rstrip(_PATH_SEPARATORS)}/{self.filename_template}"
+
+
+# Shared read-only default for ProgressEvent.raw
+_NO_RAW: Mapping[str, Any] = MappingProxyType({})
+
 
+class ProgressEvent(NamedTuple):
+    """Event object passed to progress callbacks.
 
-@dataclass
-class ProgressEvent:
-    """Event object passed to progress callbacks."""
+    Progress and log events are created per yt-dlp tick or log line, so they are
+    lightweight named tuples rather than dataclasses.
+    """
 
     status: Literal["downloading", "finished", "error"]
     downloaded_bytes: Optional[int] = None
@@ -34,11 +63,10 @@ class ProgressEvent:
     speed: Optional[float] = None
     eta: Optional[int] = None
     filename: Optional[str] = None
-    raw: Dict[str, Any] = field(default_factory=dict)
+    raw: Mapping[str, Any] = _NO_RAW
 
 
-@dataclass
-class LogEvent:
+class LogEvent(NamedTuple):
     """Structured log event for higher level consumers."""
 
     level: Literal["debug", "info", "warning", "error"]
@@ -46,7 +74,7 @@ class LogEvent:
     context: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DownloadResult:
     """Result of a download operation."""
 
@@ -1,11 +1,30 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import hashlib
+import json
 import logging
 import os
-from typing import Any, Callable, Dict, List, Literal, Optional
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TYPE_CHECKING,
+)
 
-import yt_dlp
+from diskcache import Cache
 
 from .models import (
     DownloadConfig,
@@ -14,8 +33,182 @@ from .models import (
     LogEvent,
     ProgressCallback,
     ProgressEvent,
+    _NO_RAW,
+)
+
+if TYPE_CHECKING:
+    import aiohttp
+    import yt_dlp
+
+# Keys returned by get_info when no explicit field list is requested.
+DEFAULT_INFO_FIELDS: Tuple[str, ...] = (
+    "id",
+    "title",
+    "duration",
+    "uploader",
+    "thumbnail",
+    "webpage_url",
+    "formats",
+    "entries",
 )
 
+# Per-format keys only useful to yt-dlp's own downloader.
+_DROPPED_FORMAT_KEYS = frozenset({"http_headers", "fragments", "manifest_url"})
+
+# yt-dlp options that carry per-call callbacks rather than extraction settings.
+_CALLBACK_OPTS = frozenset({"logger", "progress_hooks"})
+
+# Options yt-dlp reads on every call rather than at construction. They are
+# applied to a pooled YoutubeDL on checkout, so downloads that differ only in
+# these share one instance and its keep-alive connections. "format" is not one
+# of them: yt-dlp builds its format selector once in YoutubeDL.__init__.
+_PER_CALL_OPTS = _CALLBACK_OPTS | {"outtmpl", "noplaylist", "playlist_items", "retries"}
+
+# Chunked ranged requests avoid googlevideo throttling and keep connections reusable.
+_HTTP_CHUNK_SIZE = 10 * 1024 * 1024
+
+_INFO_CACHE_TAG = "info"
+
+# yt-dlp progress statuses we pass through; anything else is reported as "error".
+_PROGRESS_STATUS_MAP: Dict[str, Literal["downloading", "finished"]] = {
+    "downloading": "downloading",
+    "finished": "finished",
+}
+
+# Progress events buffered by stream() before further events are dropped.
+_STREAM_QUEUE_SIZE = 256
+
+# Protocols download_async_native can fetch itself; anything else goes through yt-dlp.
+_NATIVE_PROTOCOLS = frozenset({"http", "https", "http_dash_segments"})
+
+# Bytes buffered by download_async_native before handing a write to the executor.
+_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Idle YoutubeDL instances kept per options signature and in total; extras are
+# closed on release.
+_MAX_IDLE_YDL_PER_KEY = 4
+_MAX_IDLE_YDL = 16
+
+
+def _options_key(ydl_opts: Dict[str, Any], exclude: frozenset = _CALLBACK_OPTS) -> Optional[str]:
+    """Return a stable hash of yt-dlp options, ignoring the ``exclude`` keys.
+
+    Returns None when an option (e.g. a ``match_filter`` callable) has no stable
+    JSON form; such options must bypass caching and pooling.
+    """
+    normalized = {k: v for k, v in ydl_opts.items() if k not in exclude}
+    try:
+        payload = json.dumps(normalized, sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def _close_ydl_instances(pool: Dict[str, List[Any]], lock: threading.Lock) -> None:
+    """Close and forget every idle YoutubeDL instance in ``pool``."""
+    with lock:
+        instances = [ydl for idle in pool.values() for ydl in idle]
+        pool.clear()
+    for ydl in instances:
+        ydl.close()
+
+
+def _project_info(info: Dict[str, Any], fields: Sequence[str]) -> Dict[str, Any]:
+    """Keep only ``fields`` of an info dict, applied recursively to playlist entries."""
+    projected = {key: info[key] for key in fields if key in info}
+    if "formats" in projected:
+        projected["formats"] = [
+            {k: v for k, v in fmt.items() if k not in _DROPPED_FORMAT_KEYS}
+            for fmt in projected["formats"]
+        ]
+    if "entries" in projected:
+        projected["entries"] = [
+            _project_info(entry, fields) for entry in projected["entries"] if entry
+        ]
+    return projected
+
+
+async def _encode_mp3(src: str) -> str:
+    """Encode ``src`` to a 192 kbps mp3 next to it, delete the source and return the new path."""
+    dst = os.path.splitext(src)[0] + ".mp3"
+    if dst == src:
+        return src
+    proc = await asyncio.create_subprocess_exec(
+        "ffmpeg", "-y", "-loglevel", "error", "-i", src,
+        "-vn", "-c:a", "libmp3lame", "-b:a", "192k", dst,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    _, stderr = await proc.communicate()
+    if proc.returncode != 0:
+        raise RuntimeError(f"ffmpeg mp3 encode failed: {stderr.decode(errors='replace').strip()}")
+    os.remove(src)
+    return dst
+
+
+def _downloaded_files(info: Dict[str, Any]) -> List[str]:
+    """Collect the file paths yt-dlp wrote for ``info``, including playlist entries."""
+    # yt-dlp returns either dict or list; we try to infer file path(s) from info
+    if "_filename" in info:
+        return [info["_filename"]]
+    if "requested_downloads" in info:
+        return [
+            item["_filename"] for item in info["requested_downloads"] if item.get("_filename")
+        ]
+    return [path for entry in info.get("entries") or [] if entry for path in _downloaded_files(entry)]
+
+
+def _remove_files(paths: List[str]) -> None:
+    """Delete ``paths``, ignoring ones that were never created."""
+    for path in paths:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(path)
+
+
+async def _merge_with_ffmpeg(parts: List[str], output: str) -> None:
+    """Mux separately downloaded streams into ``output`` and delete the parts."""
+    args = ["-y", "-loglevel", "error"]
+    for part in parts:
+        args += ["-i", part]
+    for index in range(len(parts)):
+        args += ["-map", str(index)]
+    args += ["-c", "copy", output]
+
+    proc = await asyncio.create_subprocess_exec(
+        "ffmpeg", *args, stderr=asyncio.subprocess.PIPE
+    )
+    _, stderr = await proc.communicate()
+    if proc.returncode != 0:
+        raise RuntimeError(f"ffmpeg merge failed: {stderr.decode(errors='replace').strip()}")
+    for part in parts:
+        os.remove(part)
+
+
+def _translate_status(
+    status: Dict[str, Any],
+    include_raw: bool = False,
+    _event: Callable[..., ProgressEvent] = ProgressEvent,
+    _map_status: Callable[[Any, str], Any] = _PROGRESS_STATUS_MAP.get,
+) -> ProgressEvent:
+    """Convert a yt-dlp progress status dict into a ProgressEvent.
+
+    The trailing parameters pre-bind globals as locals for this per-tick path.
+    """
+    get = status.get
+    return _event(
+        # yt-dlp may not have explicit error in progress hooks; we reserve this
+        status=_map_status(get("status"), "error"),
+        downloaded_bytes=get("downloaded_bytes"),
+        total_bytes=get("total_bytes") or get("total_bytes_estimate"),
+        speed=get("speed"),
+        eta=get("eta"),
+        filename=get("filename") or (get("info_dict") or {}).get("filename"),
+        raw=status if include_raw else _NO_RAW,
+    )
+
+
+def _discard(msg: str) -> None:
+    """Log sink used when no log callback is registered."""
+
 
 class _YtDlpLogger:
     """Adapter to route yt-dlp logs into Python logging and optional callbacks."""
@@ -23,27 +216,42 @@ class _YtDlpLogger:
     def __init__(self, logger: logging.Logger, on_log: Optional[LogCallback]) -> None:
         self._logger = logger
         self._on_log = on_log
+        # Specialize the emitters once so yt-dlp's chatty debug channel does not
+        # re-check for a callback on every line.
+        if on_log is None:
+            self._emit_debug = self._emit_info = _discard
+            self._emit_warning = self._emit_error = _discard
+        else:
+            self._emit_debug = self._make_emitter("debug")
+            self._emit_info = self._make_emitter("info")
+            self._emit_warning = self._make_emitter("warning")
+            self._emit_error = self._make_emitter("error")
 
     def debug(self, msg: str) -> None:
         self._logger.debug(msg)
-        self._emit("debug", msg)
+        self._emit_debug(msg)
 
     def info(self, msg: str) -> None:
         self._logger.info(msg)
-        self._emit("info", msg)
+        self._emit_info(msg)
 
     def warning(self, msg: str) -> None:
         self._logger.warning(msg)
-        self._emit("warning", msg)
+        self._emit_warning(msg)
 
     def error(self, msg: str) -> None:
         self._logger.error(msg)
-        self._emit("error", msg)
+        self._emit_error(msg)
 
-    def _emit(self, level: Literal["debug", "info", "warning", "error"], msg: str) -> None:
-        if self._on_log is not None:
-            event = LogEvent(level=level, message=msg, context=None)
-            self._on_log(event)
+    def _make_emitter(
+        self, level: Literal["debug", "info", "warning", "error"]
+    ) -> Callable[[str], None]:
+        on_log = self._on_log
+
+        def _emit(msg: str) -> None:
+            on_log(LogEvent(level=level, message=msg, context=None))
+
+        return _emit
 
 
 class YouTubeDownloadService:
@@ -54,10 +262,34 @@ class YouTubeDownloadService:
         default_output_dir: str = "downloads",
         default_proxy: Optional[str] = None,
         logger: Optional[logging.Logger] = None,
+        cache_dir: str = ".cache/youtube_downloader",
+        cache_ttl: float = 3600,
     ) -> None:
-        """Initialize the service with default options."""
+        """Initialize the service with default options.
+
+        Extracted metadata is cached on disk under ``cache_dir`` for ``cache_ttl``
+        seconds. Stream URLs signed by YouTube expire after a few hours, so keep the
+        TTL well below that; pass ``cache_ttl=0`` to disable caching.
+        """
         self._default_output_dir = default_output_dir
         self._default_proxy = default_proxy
+        self._cache_ttl = cache_ttl
+        self._info_cache = Cache(cache_dir)
+        # yt-dlp pulls in hundreds of extractor modules, so it is imported on first use
+        self._yt_dlp_mod: Any = None
+        self._ydl_pool: Dict[str, List[yt_dlp.YoutubeDL]] = {}
+        self._ydl_pool_lock = threading.Lock()
+        # Closes idle instances at exit without keeping the service alive
+        self._ydl_pool_finalizer = weakref.finalize(
+            self, _close_ydl_instances, self._ydl_pool, self._ydl_pool_lock
+        )
+        self._io_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="ytdl-io")
+        self._aiohttp_session: Optional[aiohttp.ClientSession] = None
+        # get_info_async extractions in flight, keyed by (loop, url, proxy) since the
+        # futures belong to the loop that created them
+        self._inflight: Dict[
+            Tuple[asyncio.AbstractEventLoop, str, Optional[str]], asyncio.Future[Dict[str, Any]]
+        ] = {}
 
         if logger is None:
             logger = logging.getLogger("youtube_downloader")
@@ -74,26 +306,28 @@ class YouTubeDownloadService:
 
         # Ensure default output directory exists
         os.makedirs(self._default_output_dir, exist_ok=True)
+        self._ensured_dirs: Set[str] = {self._default_output_dir}
+        self._ensured_dirs_lock = threading.Lock()
 
     # ---------------------- Public synchronous API ---------------------- #
 
-    def get_info(self, url: str, proxy: Optional[str] = None) -> Dict[str, Any]:
-        """Fetch video information without downloading."""
-        ydl_opts: Dict[str, Any] = {
-            "skip_download": True,
-            "quiet": True,
-            "no_warnings": True,
-        }
-
-        effective_proxy = proxy or self._default_proxy
-        if effective_proxy:
-            ydl_opts["proxy"] = effective_proxy
+    def get_info(
+        self,
+        url: str,
+        proxy: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Dict[str, Any]:
+        """Fetch video information without downloading.
 
-        self._logger.debug("Fetching info for URL %s", url)
+        Only the keys listed in ``fields`` (default: DEFAULT_INFO_FIELDS) are
+        returned; per-format HTTP headers and fragment lists are always dropped.
+        """
+        info = self._get_full_info(url, proxy)
+        return _project_info(info, fields or DEFAULT_INFO_FIELDS)
 
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(url, download=False)
-        return info
+    def clear_info_cache(self) -> int:
+        """Drop all cached metadata entries and return how many were removed."""
+        return self._info_cache.evict(_INFO_CACHE_TAG)
 
     def download(
         self,
@@ -102,35 +336,40 @@ class YouTubeDownloadService:
         on_log: Optional[LogCallback] = None,
     ) -> DownloadResult:
         """Download content according to the provided configuration."""
+        return self._download(config, on_progress, on_log)
+
+    def _download(
+        self,
+        config: DownloadConfig,
+        on_progress: Optional[ProgressCallback],
+        on_log: Optional[LogCallback],
+        extract_audio: bool = True,
+    ) -> DownloadResult:
+        """Run a yt-dlp download; see _build_yt_dlp_options for ``extract_audio``."""
         self._logger.info("Starting download for URL %s", config.url)
 
         # Ensure output directory exists
         output_dir = config.output_dir or self._default_output_dir
-        os.makedirs(output_dir, exist_ok=True)
+        self._ensure_dir(output_dir)
 
-        ydl_opts = self._build_yt_dlp_options(config, output_dir, on_progress, on_log)
+        ydl_opts = self._build_yt_dlp_options(config, on_progress, on_log, extract_audio)
 
         filepaths: List[str] = []
         info: Dict[str, Any] = {}
         errors: List[str] = []
 
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(config.url, download=True)
-                # yt-dlp returns either dict or list; we try to infer file path(s) from info
-                if "_filename" in info:
-                    filepaths.append(info["_filename"])
-                elif "requested_downloads" in info:
-                    for item in info.get("requested_downloads", []):
-                        path = item.get("_filename")
-                        if path:
-                            filepaths.append(path)
+            extracted = self._extract_info(config.url, ydl_opts)
+            with self._pooled_ydl(ydl_opts) as ydl:
+                info = ydl.process_ie_result(extracted, download=True)
+                filepaths.extend(_downloaded_files(info))
 
             self._logger.info("Download succeeded for URL %s", config.url)
             return DownloadResult(success=True, filepaths=filepaths, info=info, errors=[])
         except Exception as exc:  # noqa: BLE001
             msg = f"Download failed for URL {config.url}: {exc}"
             self._logger.error(msg)
+            self._invalidate_info(config.url, ydl_opts)
             errors.append(str(exc))
             if on_log is not None:
                 on_log(LogEvent(level="error", message=msg, context=None))
@@ -193,12 +432,48 @@ class YouTubeDownloadService:
         )
         return self.download(config, on_progress=on_progress, on_log=on_log)
 
+    def close(self) -> None:
+        """Release the worker pools, pooled yt-dlp instances and metadata cache."""
+        self._io_executor.shutdown(wait=False, cancel_futures=True)
+        # Running the finalizer closes the pool and detaches it from exit handling
+        self._ydl_pool_finalizer()
+        self._info_cache.close()
+
     # ---------------------- Async wrappers (future ready) ---------------------- #
+    #
+    # Blocking yt-dlp work runs on the service's own "ytdl-io" thread pool rather
+    # than the loop's default executor. Progress and log callbacks are invoked on
+    # those worker threads, so callbacks touching asyncio objects must marshal back
+    # with ``loop.call_soon_threadsafe``.
+
+    async def aclose(self) -> None:
+        """Async counterpart of close(), also closing the native download session."""
+        if self._aiohttp_session is not None:
+            await self._aiohttp_session.close()
+            self._aiohttp_session = None
+        self.close()
+
+    async def get_info_async(
+        self,
+        url: str,
+        proxy: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Dict[str, Any]:
+        """Async wrapper for get_info using a thread pool.
 
-    async def get_info_async(self, url: str, proxy: Optional[str] = None) -> Dict[str, Any]:
-        """Async wrapper for get_info using a thread pool."""
+        Concurrent calls on the same event loop for the same URL and proxy share a
+        single extraction.
+        """
         loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, self.get_info, url, proxy)
+        key = (loop, url, proxy or self._default_proxy)
+        future = self._inflight.get(key)
+        if future is None:
+            future = loop.run_in_executor(self._io_executor, self._get_full_info, url, proxy)
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield the shared extraction from cancellation of any single caller
+        info = await asyncio.shield(future)
+        return _project_info(info, fields or DEFAULT_INFO_FIELDS)
 
     async def download_async(
         self,
@@ -206,27 +481,432 @@ class YouTubeDownloadService:
         on_progress: Optional[ProgressCallback] = None,
         on_log: Optional[LogCallback] = None,
     ) -> DownloadResult:
-        """Async wrapper for download using a thread pool."""
+        """Async wrapper for download using a thread pool.
+
+        Audio-only downloads are converted to mp3 by an ffmpeg subprocess awaited on
+        the event loop, so the worker thread is free for the next download while
+        the previous one encodes.
+        """
         loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, self.download, config, on_progress, on_log)
+        encode = config.audio_only and "postprocessors" not in config.extra_yt_dlp_options
+        result = await loop.run_in_executor(
+            self._io_executor, self._download, config, on_progress, on_log, not encode
+        )
+        if not (encode and result.success):
+            return result
+
+        try:
+            filepaths = list(await asyncio.gather(*map(_encode_mp3, result.filepaths)))
+        except Exception as exc:  # noqa: BLE001
+            msg = f"Audio conversion failed for URL {config.url}: {exc}"
+            self._logger.error(msg)
+            if on_log is not None:
+                on_log(LogEvent(level="error", message=msg, context=None))
+            return DownloadResult(
+                success=False, filepaths=result.filepaths, info=result.info, errors=[str(exc)]
+            )
+        return DownloadResult(success=True, filepaths=filepaths, info=result.info, errors=[])
+
+    async def download_async_native(
+        self,
+        config: DownloadConfig,
+        on_progress: Optional[ProgressCallback] = None,
+        on_log: Optional[LogCallback] = None,
+    ) -> DownloadResult:
+        """Download media bytes on the event loop instead of a worker thread.
+
+        Extraction and file naming still run on the I/O executor, but the selected
+        formats are fetched through a shared, connection-pooled aiohttp session and
+        merged with FFmpeg when video and audio arrive as separate streams. Progress
+        callbacks are invoked on the event loop. Playlists, audio extraction and
+        formats served over other protocols (e.g. HLS) fall back to download_async.
+        Requires the optional ``aiohttp`` dependency.
+        """
+        if config.audio_only or config.playlist_items is not None:
+            # Known up front: skip the extraction the fallback would repeat anyway
+            return await self.download_async(config, on_progress, on_log)
+
+        self._logger.info("Starting native download for URL %s", config.url)
+        loop = asyncio.get_running_loop()
+        output_dir = config.output_dir or self._default_output_dir
+        self._ensure_dir(output_dir)
+        ydl_opts = self._build_yt_dlp_options(config, None, on_log)
+
+        info: Dict[str, Any] = {}
+        # Files written so far, removed again if the download fails
+        written: List[str] = []
+        try:
+            info, filename = await loop.run_in_executor(
+                self._io_executor, self._resolve_native_download, config.url, ydl_opts
+            )
+            streams = info.get("requested_formats") or [info]
+            if (
+                info.get("_type", "video") != "video"
+                or any(fmt.get("protocol") not in _NATIVE_PROTOCOLS for fmt in streams)
+            ):
+                self._logger.debug("Falling back to yt-dlp download for URL %s", config.url)
+                return await self.download_async(config, on_progress, on_log)
+
+            proxy = config.proxy or self._default_proxy
+            if len(streams) == 1:
+                written.append(filename)
+                await self._fetch_format(streams[0], filename, proxy, config.timeout, on_progress)
+            else:
+                base = os.path.splitext(filename)[0]
+                parts = [f"{base}.f{fmt['format_id']}.{fmt['ext']}" for fmt in streams]
+                written.extend(parts + [filename])
+                fetches = [
+                    asyncio.ensure_future(
+                        self._fetch_format(fmt, part, proxy, config.timeout, on_progress)
+                    )
+                    for fmt, part in zip(streams, parts)
+                ]
+                try:
+                    await asyncio.gather(*fetches)
+                except BaseException:
+                    # Stop sibling streams before their part files are cleaned up
+                    for fetch in fetches:
+                        fetch.cancel()
+                    await asyncio.gather(*fetches, return_exceptions=True)
+                    raise
+                await _merge_with_ffmpeg(parts, filename)
+
+            self._logger.info("Download succeeded for URL %s", config.url)
+            return DownloadResult(success=True, filepaths=[filename], info=info, errors=[])
+        except Exception as exc:  # noqa: BLE001
+            msg = f"Download failed for URL {config.url}: {exc}"
+            self._logger.error(msg)
+            self._invalidate_info(config.url, ydl_opts)
+            _remove_files(written)
+            if on_log is not None:
+                on_log(LogEvent(level="error", message=msg, context=None))
+            return DownloadResult(success=False, filepaths=[], info=info, errors=[str(exc)])
+        except BaseException:
+            # Cancelled (e.g. the HTTP client went away): still drop partial files
+            _remove_files(written)
+            raise
+
+    async def stream(
+        self,
+        config: DownloadConfig,
+        on_log: Optional[LogCallback] = None,
+    ) -> AsyncIterator[ProgressEvent]:
+        """Download content and yield progress events as they happen.
+
+        The progress hook running on the download thread only schedules a
+        non-blocking enqueue on the event loop, so a slow consumer never stalls the
+        download itself. Events arriving while the queue is full are dropped.
+
+        If the download fails, a final ``"error"`` event is yielded whose ``raw``
+        holds the ``errors`` list of the DownloadResult.
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[Optional[ProgressEvent]] = asyncio.Queue()
+
+        def _offer(event: ProgressEvent) -> None:
+            if queue.qsize() < _STREAM_QUEUE_SIZE:
+                queue.put_nowait(event)
+
+        def _run() -> DownloadResult:
+            try:
+                return self.download(
+                    config,
+                    on_progress=lambda event: loop.call_soon_threadsafe(_offer, event),
+                    on_log=on_log,
+                )
+            finally:
+                # The sentinel bypasses _offer so it is never dropped
+                loop.call_soon_threadsafe(queue.put_nowait, None)
+
+        future = loop.run_in_executor(self._io_executor, _run)
+        while True:
+            event = await queue.get()
+            if event is None:
+                break
+            yield event
+
+        result = await future
+        if not result.success:
+            yield ProgressEvent(status="error", raw={"errors": list(result.errors)})
+
+    async def download_many(
+        self,
+        configs: List[DownloadConfig],
+        concurrency: int = 4,
+        on_progress: Optional[ProgressCallback] = None,
+        on_log: Optional[LogCallback] = None,
+    ) -> List[DownloadResult]:
+        """Download several configs concurrently, at most ``concurrency`` at a time.
+
+        Results are returned in the same order as ``configs``.
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        sem = asyncio.Semaphore(concurrency)
+
+        async def _one(config: DownloadConfig) -> DownloadResult:
+            async with sem:
+                return await self.download_async(config, on_progress, on_log)
+
+        return await asyncio.gather(*(_one(config) for config in configs))
 
     # ---------------------- Internal helpers ---------------------- #
 
+    def _get_full_info(self, url: str, proxy: Optional[str]) -> Dict[str, Any]:
+        """Fetch the complete (sanitized) info dict used by get_info."""
+        ydl_opts: Dict[str, Any] = {
+            "skip_download": True,
+            "quiet": True,
+            "no_warnings": True,
+        }
+
+        effective_proxy = proxy or self._default_proxy
+        if effective_proxy:
+            ydl_opts["proxy"] = effective_proxy
+
+        self._logger.debug("Fetching info for URL %s", url)
+
+        return self._extract_info(url, ydl_opts)
+
+    def _extract_info(self, url: str, ydl_opts: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract info without downloading, served from the metadata cache when possible.
+
+        The info dict is sanitized so it can be pickled to disk; it can still be fed
+        back into ``YoutubeDL.process_ie_result`` to perform the actual download.
+        """
+        key = self._info_cache_key(url, ydl_opts)
+        cacheable = bool(self._cache_ttl) and key is not None
+        if cacheable:
+            cached = self._info_cache.get(key)
+            if cached is not None:
+                self._logger.debug("Using cached info for URL %s", url)
+                return cached
+
+        with self._pooled_ydl(ydl_opts) as ydl:
+            info = ydl.sanitize_info(ydl.extract_info(url, download=False))
+
+        if cacheable:
+            self._info_cache.set(key, info, expire=self._cache_ttl, tag=_INFO_CACHE_TAG)
+        return info
+
+    def _invalidate_info(self, url: str, ydl_opts: Dict[str, Any]) -> None:
+        """Drop the cached info for a failed download so a retry re-extracts.
+
+        The failure may come from the cached info itself, e.g. an expired signed
+        stream URL.
+        """
+        key = self._info_cache_key(url, ydl_opts)
+        if key is not None:
+            self._info_cache.delete(key)
+
+    @staticmethod
+    def _info_cache_key(url: str, ydl_opts: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+        """Return the metadata cache key, or None when the options can't be keyed."""
+        options_key = _options_key(ydl_opts)
+        return None if options_key is None else (url, options_key)
+
+    def _resolve_native_download(
+        self, url: str, ydl_opts: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], str]:
+        """Return the (cached) info dict and target filename for a native download."""
+        info = self._extract_info(url, ydl_opts)
+        with self._pooled_ydl(ydl_opts) as ydl:
+            filename = ydl.prepare_filename(info)
+        return info, filename
+
+    def _http_session(self) -> aiohttp.ClientSession:
+        """Return the shared aiohttp session, creating it on the running loop."""
+        if self._aiohttp_session is None or self._aiohttp_session.closed:
+            import aiohttp
+
+            connector = aiohttp.TCPConnector(limit=100, limit_per_host=20, keepalive_timeout=30)
+            self._aiohttp_session = aiohttp.ClientSession(connector=connector)
+        return self._aiohttp_session
+
+    async def _fetch_format(
+        self,
+        fmt: Dict[str, Any],
+        path: str,
+        proxy: Optional[str],
+        timeout: Optional[int],
+        on_progress: Optional[ProgressCallback],
+    ) -> None:
+        """Fetch a single selected format to ``path`` with ranged or fragment requests."""
+        import aiohttp
+
+        session = self._http_session()
+        headers = fmt.get("http_headers") or {}
+        request_timeout = aiohttp.ClientTimeout(sock_read=timeout)
+        total = fmt.get("filesize") or fmt.get("filesize_approx")
+        downloaded = 0
+
+        def _report(status: Literal["downloading", "finished"]) -> None:
+            if on_progress is not None:
+                on_progress(
+                    ProgressEvent(
+                        status=status,
+                        downloaded_bytes=downloaded,
+                        total_bytes=total,
+                        filename=path,
+                    )
+                )
+
+        loop = asyncio.get_running_loop()
+        fh = await loop.run_in_executor(self._io_executor, open, path, "wb")
+        buffer = bytearray()
+
+        async def _flush() -> None:
+            if buffer:
+                data = bytes(buffer)
+                buffer.clear()
+                await loop.run_in_executor(self._io_executor, fh.write, data)
+
+        async def _consume(resp: aiohttp.ClientResponse) -> int:
+            # Disk writes go to the I/O executor in batches, off the event loop
+            nonlocal downloaded
+            received = 0
+            async for chunk in resp.content.iter_chunked(64 * 1024):
+                buffer.extend(chunk)
+                received += len(chunk)
+                downloaded += len(chunk)
+                if len(buffer) >= _WRITE_BUFFER_SIZE:
+                    await _flush()
+                _report("downloading")
+            return received
+
+        try:
+            if fmt.get("fragments"):
+                base_url = fmt.get("fragment_base_url") or ""
+                for fragment in fmt["fragments"]:
+                    frag_url = fragment.get("url") or base_url + fragment["path"]
+                    async with session.get(
+                        frag_url, headers=headers, proxy=proxy, timeout=request_timeout
+                    ) as resp:
+                        resp.raise_for_status()
+                        await _consume(resp)
+            else:
+                while True:
+                    byte_range = f"bytes={downloaded}-{downloaded + _HTTP_CHUNK_SIZE - 1}"
+                    async with session.get(
+                        fmt["url"],
+                        headers={**headers, "Range": byte_range},
+                        proxy=proxy,
+                        timeout=request_timeout,
+                    ) as resp:
+                        if resp.status == 416:
+                            break
+                        resp.raise_for_status()
+                        if resp.status != 206 and downloaded:
+                            # Appending a full body after earlier ranges would corrupt the file
+                            raise RuntimeError(
+                                f"server ignored Range request at byte {downloaded} for {path}"
+                            )
+                        received = await _consume(resp)
+                    # A 200 means the server ignored the range and sent everything
+                    if resp.status != 206 or received < _HTTP_CHUNK_SIZE:
+                        break
+            await _flush()
+        finally:
+            await loop.run_in_executor(self._io_executor, fh.close)
+
+        _report("finished")
+
+    def _ensure_dir(self, path: str) -> None:
+        """Create ``path`` once per service instead of on every download."""
+        if path in self._ensured_dirs:
+            return
+        with self._ensured_dirs_lock:
+            os.makedirs(path, exist_ok=True)
+            self._ensured_dirs.add(path)
+
+    def _ytdlp(self) -> Any:
+        """Import yt_dlp on first use and return the module."""
+        if self._yt_dlp_mod is None:
+            import yt_dlp
+
+            self._yt_dlp_mod = yt_dlp
+        return self._yt_dlp_mod
+
+    @contextlib.contextmanager
+    def _pooled_ydl(self, ydl_opts: Dict[str, Any]) -> Iterator[yt_dlp.YoutubeDL]:
+        """Check out a long-lived YoutubeDL instance configured with ``ydl_opts``.
+
+        Instances are pooled per options signature so their HTTP connections stay
+        alive between calls. A checked-out instance is used by a single thread; the
+        options in _PER_CALL_OPTS are swapped in on every checkout. Options without
+        a stable signature get a throwaway instance.
+        """
+        key = _options_key(ydl_opts, exclude=_PER_CALL_OPTS)
+        ydl = None
+        if key is not None:
+            with self._ydl_pool_lock:
+                idle = self._ydl_pool.get(key)
+                if idle:
+                    ydl = idle.pop()
+                    if not idle:
+                        del self._ydl_pool[key]
+
+        if ydl is None:
+            # yt-dlp keeps and mutates the params dict, so hand it a copy
+            ydl = self._ytdlp().YoutubeDL(dict(ydl_opts))
+        for name in _PER_CALL_OPTS:
+            value = ydl_opts.get(name)
+            if value is None:
+                ydl.params.pop(name, None)
+            else:
+                # outtmpl may be a dict that yt-dlp fills in place
+                ydl.params[name] = dict(value) if isinstance(value, dict) else value
+        # yt-dlp normalizes outtmpl and copies progress_hooks at construction time
+        ydl._parse_outtmpl()
+        ydl._progress_hooks = list(ydl_opts.get("progress_hooks", []))
+        # Per-run counters behind %(autonumber)s, max_downloads and the return code
+        ydl._num_downloads = 0
+        ydl._download_retcode = 0
+
+        try:
+            yield ydl
+        finally:
+            # Don't let an idle instance keep the caller's callbacks (and, for
+            # stream(), its event loop and queue) alive
+            ydl.params["logger"] = None
+            ydl.params.pop("progress_hooks", None)
+            ydl._progress_hooks = []
+            if key is not None:
+                with self._ydl_pool_lock:
+                    total_idle = sum(len(idle) for idle in self._ydl_pool.values())
+                    idle = self._ydl_pool.setdefault(key, [])
+                    if len(idle) < _MAX_IDLE_YDL_PER_KEY and total_idle < _MAX_IDLE_YDL:
+                        idle.append(ydl)
+                        ydl = None
+                    elif not idle:
+                        del self._ydl_pool[key]
+            if ydl is not None:
+                ydl.close()
+
     def _build_yt_dlp_options(
         self,
         config: DownloadConfig,
-        output_dir: str,
         on_progress: Optional[ProgressCallback],
         on_log: Optional[LogCallback],
+        extract_audio: bool = True,
     ) -> Dict[str, Any]:
-        """Map DownloadConfig and callbacks to yt-dlp options."""
+        """Map DownloadConfig and callbacks to yt-dlp options.
+
+        With ``extract_audio=False``, audio-only downloads skip yt-dlp's mp3
+        conversion and keep the downloaded audio file as-is.
+        """
         ydl_opts: Dict[str, Any] = {
-            "outtmpl": os.path.join(output_dir, config.filename_template),
+            "outtmpl": config.resolved_outtmpl(self._default_output_dir),
             "format": config.format,
             "noplaylist": config.playlist_items is None,
             "logger": _YtDlpLogger(self._logger, on_log),
-            "progress_hooks": [self._make_progress_hook(on_progress)] if on_progress else [],
+            "progress_hooks": (
+                [self._make_progress_hook(on_progress, config.include_raw_progress)]
+                if on_progress
+                else []
+            ),
             "retries": config.retries,
+            "http_chunk_size": _HTTP_CHUNK_SIZE,
         }
 
         # Apply proxy
@@ -246,47 +926,30 @@ class YouTubeDownloadService:
         if config.audio_only:
             # Extract best available audio and convert to mp3 by default
             ydl_opts.setdefault("format", "bestaudio/best")
-            ydl_opts.setdefault("postprocessors", []).append(
-                {
-                    "key": "FFmpegExtractAudio",
-                    "preferredcodec": "mp3",
-                    "preferredquality": "192",
-                }
-            )
+            if extract_audio:
+                ydl_opts.setdefault("postprocessors", []).append(
+                    {
+                        "key": "FFmpegExtractAudio",
+                        "preferredcodec": "mp3",
+                        "preferredquality": "192",
+                    }
+                )
 
         # Merge extra user-defined options last
         ydl_opts.update(config.extra_yt_dlp_options)
 
         return ydl_opts
 
-    def _make_progress_hook(self, on_progress: Optional[ProgressCallback]) -> Callable[[Dict[str, Any]], None]:
+    def _make_progress_hook(
+        self, on_progress: ProgressCallback, include_raw: bool = False
+    ) -> Callable[[Dict[str, Any]], None]:
         """Create a yt-dlp progress hook that forwards events to ProgressCallback."""
 
-        def _hook(status: Dict[str, Any]) -> None:
-            if on_progress is None:
-                return
-
-            event_status: Literal["downloading", "finished", "error"]
-            raw_status = status.get("status")
-            if raw_status == "downloading":
-                event_status = "downloading"
-            elif raw_status == "finished":
-                event_status = "finished"
-            else:
-                # yt-dlp may not have explicit error in progress hooks; we reserve this
-                event_status = "error"
-
-            event = ProgressEvent(
-                status=event_status,
-                downloaded_bytes=status.get("downloaded_bytes"),
-                total_bytes=status.get("total_bytes") or status.get("total_bytes_estimate"),
-                speed=status.get("speed"),
-                eta=status.get("eta"),
-                filename=status.get("filename") or status.get("info_dict", {}).get("filename"),
-                raw=status,
-            )
-            on_progress(event)
+        def _hook(
+            status: Dict[str, Any],
+            _on_progress: ProgressCallback = on_progress,
+            _include_raw: bool = include_raw,
+        ) -> None:
+            _on_progress(_translate_status(status, _include_raw))
 
         return _hook
-
-